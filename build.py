@@ -7,15 +7,80 @@
 #
 # Distributed under terms of the MIT license.
 # --------------------------------------------------------------------
+import asyncio
+import hashlib
+import json
+import os
 import shlex
+import shutil
+import sysconfig
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-from xeno.build import Recipe, ValueRecipe, build, default, provide, sh, target, factory
-from xeno.shell import check
+from xeno.build import Event, Recipe, ShellFileRecipe, ValueRecipe, build, default, provide, sh, target, factory
+from xeno.shell import check as _check
+
+# -------------------------------------------------------------------
+CHECK_POOL = ThreadPoolExecutor(max_workers=3)
+
+# -------------------------------------------------------------------
+@lru_cache(maxsize=None)
+def check_async(cmd):
+    return CHECK_POOL.submit(_check, cmd)
+
+
+# -------------------------------------------------------------------
+def check(cmd):
+    return check_async(cmd).result()
+
+
+# -------------------------------------------------------------------
+def write_if_changed(path, content):
+    """ Write `content` to `path` unless it already holds it, keeping the mtime stable. """
+    path = Path(path)
+    if not path.exists() or path.read_text() != content:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return path
+
+
+# -------------------------------------------------------------------
+def response_file(name, flags):
+    """ Write `flags` to build/<name>.rsp and return the `@file` argument naming it. """
+    content = "".join(shlex.quote(flag) + "\n" for flag in flags)
+    return "@%s" % write_if_changed(Path("build") / f"{name}.rsp", content)
+
+
+# -------------------------------------------------------------------
+def default_jobs(gb_per_job=2):
+    """
+    One job per CPU, capped so that each job can count on `gb_per_job`
+    of MemAvailable (a pybind11 TU can take ~1GB in clang).
+    """
+    cpus = os.cpu_count() or 1
+    try:
+        with open("/proc/meminfo") as meminfo:
+            fields = dict(line.split(":", 1) for line in meminfo)
+        available = int(fields["MemAvailable"].split()[0]) * 1024
+    except (OSError, KeyError, ValueError):
+        return cpus
+    return max(1, min(cpus, available // (gb_per_job * 1024 ** 3)))
+
 
 # -------------------------------------------------------------------
 PYPI_USERNAME = "lainproliant"
 PYPI_KEY_NAME = "pypi"
+JOBS = default_jobs()
+SDIST_FILES = ("setup.py", "MANIFEST.in", "README.md")
+SDIST_SUBMODULES = ("moonlight", "pybind11")
+
+PYTHON_INCLUDES = tuple(dict.fromkeys(
+    "-I%s" % sysconfig.get_paths()[key] for key in ("include", "platinclude")
+))
+EXT_SUFFIX = sysconfig.get_config_var("EXT_SUFFIX")
+OBJ_DIR = Path("build") / "obj"
+PCH_DIR = Path("build") / "pch"
 
 # -------------------------------------------------------------------
 INCLUDES = [
@@ -26,40 +91,129 @@ INCLUDES = [
 
 LDFLAGS=('-rdynamic', '-g', '-ldl')
 
-RELEASE_CFLAGS=(
+LINKER = "mold" if shutil.which("mold") else ("lld" if shutil.which("ld.lld") else None)
+
+RELEASE_LDFLAGS=(
+    *(('-fuse-ld=%s' % LINKER, '-Wl,--icf=safe', '-Wl,--gc-sections') if LINKER else ()),
+    *(('-Wl,--thinlto-jobs=all',) if LINKER == "lld" else ()),
+)
+
+CCACHE = None if os.environ.get("JOTDOWN_NO_CCACHE") else shutil.which("ccache")
+CXX = shutil.which("clang++") or "clang++"
+CC = shlex.join([CCACHE, CXX]) if CCACHE else CXX
+
+PREFETCH_CHECKS = (
+    "git submodule status",
+    f"{CXX} --version",
+)
+
+CCACHE_ENV = dict(
+    CCACHE_DIR=os.environ.get("CCACHE_DIR", str(Path.home() / ".ccache")),
+    CCACHE_BASEDIR=str(Path.cwd()),
+    CCACHE_COMPILERCHECK="content",
+    CCACHE_SLOPPINESS="pch_defines,time_macros,include_file_mtime",
+)
+
+CFLAGS=(
     *INCLUDES,
     "--std=c++2a"
 )
 
+RELEASE_CFLAGS=(
+    *CFLAGS,
+    "-O3",
+    "-DNDEBUG",
+    # ThinLTO objects need an LLVM-aware linker; without mold or lld the
+    # system ld would need the LLVMgold plugin to read them.
+    *(("-flto=thin",) if LINKER else ()),
+)
+
 TEST_CFLAGS=(
-    *RELEASE_CFLAGS,
-    "-DMOONLIGHT_AUTOMATA_DEBUG",
-    "-DMOONLIGHT_DEBUG",
-    "-DMOONLIGHT_ENABLE_STACKTRACE",
-    "-DMOONLIGHT_AUTOMATA_DEBUG",
-    "-DMOONLIGHT_STACKTRACE_IN_DESCRIPTION",
+    *CFLAGS,
+    "-include",
+    "include/jotdown/debug_config.h",
 )
 
 RELEASE_ENV = dict(
-    CC="clang++",
-    CFLAGS=RELEASE_CFLAGS,
-    LDFLAGS=LDFLAGS
+    CC=CC,
+    CFLAGS=response_file("release", RELEASE_CFLAGS),
+    LDFLAGS=(*LDFLAGS, *RELEASE_LDFLAGS),
+    **CCACHE_ENV
 )
 
 TEST_ENV = dict(
-    CC="clang++",
-    CFLAGS=TEST_CFLAGS,
-    LDFLAGS=LDFLAGS
+    CC=CC,
+    CFLAGS=response_file("test", TEST_CFLAGS),
+    LDFLAGS=LDFLAGS,
+    **CCACHE_ENV
 )
 
+# -------------------------------------------------------------------
+def depfile_headers(depfile, fallback):
+    """
+    Read the source and headers a translation unit was actually built from
+    out of the dependency file written by `-MMD` on its last compile,
+    falling back to `fallback` if it hasn't been compiled yet.
+    """
+    depfile = Path(depfile)
+    if not depfile.exists():
+        return list(fallback)
+    rule = depfile.read_text().replace("\\\n", " ").split("\n", 1)[0]
+    _, _, deps = rule.partition(": ")
+    return [Path(dep) for dep in deps.split() if Path(dep).exists()]
+
+
+# -------------------------------------------------------------------
+@lru_cache(maxsize=None)
+def scan(subdir, suffix):
+    """ List the files directly under `subdir` ending in `suffix`, in one directory walk. """
+    with os.scandir(Path.cwd() / subdir) as entries:
+        return tuple(sorted(
+            Path(entry.path) for entry in entries
+            if entry.name.endswith(suffix) and entry.is_file()
+        ))
+
+
+# -------------------------------------------------------------------
+@lru_cache(maxsize=None)
+def file_digest(path, mtime_ns, size):
+    """ SHA-256 of a file's contents, memoised on its mtime and size. """
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+# -------------------------------------------------------------------
+def restore_unchanged_mtimes(paths, cache):
+    """
+    Reset the mtime of any file whose contents match the digest recorded
+    for it in `cache` last time, so that touching a file without changing
+    it (e.g. a branch switch) doesn't make everything depending on it
+    look outdated.  Records the current digest and mtime of every file.
+    """
+    cache = Path(cache)
+    known = json.loads(cache.read_text()) if cache.exists() else {}
+    for path in paths:
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        stat = path.stat()
+        if str(path) in known and known[str(path)][0] == digest:
+            mtime_ns = known[str(path)][1]
+            if stat.st_mtime_ns != mtime_ns:
+                os.utime(path, ns=(stat.st_atime_ns, mtime_ns))
+        else:
+            known[str(path)] = [digest, stat.st_mtime_ns]
+    write_if_changed(cache, json.dumps(known, indent=4, sort_keys=True))
+
+
 # -------------------------------------------------------------------
 def compile_app(src, headers, env):
-    return sh(
-        "{CC} {CFLAGS} {src} {LDFLAGS} -o {output}",
+    depfile = OBJ_DIR / Path(os.path.relpath(src)).with_suffix(".d")
+    depfile.parent.mkdir(parents=True, exist_ok=True)
+    return CompileRecipe(
+        "{CC} {CFLAGS} -MMD -MP -MF {depfile} {src} {LDFLAGS} -o {output}",
         env=env,
         src=src,
+        depfile=depfile,
         output=Path(src).with_suffix(""),
-        includes=headers,
+        requires=depfile_headers(depfile, headers),
     )
 
 
@@ -76,17 +230,142 @@ def compile_demo(src, headers, env):
 # -------------------------------------------------------------------
 @factory
 def run_test(app):
-    return sh("{test}", test=app, cwd="test", interactive=True)
+    return sh("{test}", test=app, cwd="test")
 
 # -------------------------------------------------------------------
 @factory
-def link_pybind11_module(pybind11_module_objects):
-    return sh(
-        "{CC} -O3 -shared -Wall -std=c++2a -fPIC {input} -o {output}",
+def link_pybind11_module(pybind11_module_objects, outdir):
+    outdir.mkdir(parents=True, exist_ok=True)
+    output = outdir / ("jotdown%s" % EXT_SUFFIX)
+    return HashedRecipe(
+        "{CC} {CFLAGS} -shared -Wall -fPIC -Wl,-O2 {ldflags} {input} -o {output}",
         env=RELEASE_ENV,
+        ldflags=RELEASE_LDFLAGS,
         input=pybind11_module_objects,
-        output=Path("jotdown%s" % check("python3-config --extension-suffix")),
-    )
+        output=output,
+    ).named(str(output))
+
+
+# -------------------------------------------------------------------
+_JOB_SLOTS = None
+
+
+def job_slots():
+    """
+    The semaphore bounding every compile and link in the build to JOBS at
+    once, created inside the running loop on first use.
+    """
+    global _JOB_SLOTS
+    if _JOB_SLOTS is None:
+        _JOB_SLOTS = asyncio.Semaphore(JOBS)
+    return _JOB_SLOTS
+
+
+# -------------------------------------------------------------------
+class CompileRecipe(ShellFileRecipe):
+    """ A compile or link that holds one of the shared job slots while it runs. """
+    async def make(self):
+        async with job_slots():
+            await super().make()
+
+
+# -------------------------------------------------------------------
+class HashedRecipe(CompileRecipe):
+    """
+    A shell file recipe that is outdated when its inputs' contents change,
+    not their mtimes.  The digest covers the compiler version, the full
+    command line, every source file named on it (including `@file`
+    response files) and its `requires`, and is kept under build/cache.
+    Files built by input recipes are taken by mtime and size rather than
+    read back, and the compiler binaries themselves are left to the
+    version string.
+
+    If a `depfile` param is given, `requires` is extended with the files
+    it lists (or `fallback` before the first compile), and re-read after
+    each compile so the stamp matches what the next run will compare.
+    """
+    CACHE = Path("build") / "cache"
+
+    def __init__(self, cmd, fallback=(), requires=(), **params):
+        self.depfile = params.get("depfile")
+        self.fallback = tuple(fallback)
+        self.extra_requires = tuple(requires)
+        super().__init__(cmd, requires=self.current_requires(), **params)
+
+    def current_requires(self):
+        if self.depfile is None:
+            return [*self.fallback, *self.extra_requires]
+        return [*depfile_headers(self.depfile, self.fallback), *self.extra_requires]
+
+    @property
+    def stamp(self):
+        name = hashlib.sha1(str(self.output.absolute()).encode("utf-8")).hexdigest()
+        return self.CACHE / name
+
+    @property
+    def generated(self):
+        """ The files produced by this recipe's input recipes. """
+        outputs, pending = set(), list(self.inputs)
+        while pending:
+            recipe = pending.pop()
+            if isinstance(recipe, ShellFileRecipe):
+                outputs.add(recipe.output)
+            else:
+                pending.extend(recipe.inputs)
+        return outputs
+
+    @property
+    def digest(self):
+        cmd = self.shell.interpolate(self.cmd, self._merge_params())
+        paths = {Path(arg.lstrip("@")) for arg in shlex.split(cmd)}
+        paths.update(self.requires)
+        paths.difference_update({self.output, self.depfile, *map(Path, shlex.split(CC))})
+        generated = self.generated
+        sha = hashlib.sha256()
+        sha.update(check(f"{CXX} --version").encode("utf-8"))
+        sha.update(cmd.encode("utf-8"))
+        for path in sorted(p for p in paths if p.is_file()):
+            stat = path.stat()
+            if path in generated:
+                sha.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}\n".encode("utf-8"))
+            else:
+                sha.update(f"{path}:{file_digest(path, stat.st_mtime_ns, stat.st_size)}\n".encode("utf-8"))
+        return sha.hexdigest()
+
+    @property
+    def outdated(self):
+        if self.inputs_outdated or not self.stamp.exists():
+            return True
+        return self.stamp.read_text() != self.digest
+
+    async def make(self):
+        await super().make()
+        self.requires = self.current_requires()
+        write_if_changed(self.stamp, self.digest)
+
+
+# -------------------------------------------------------------------
+class JobPool(Recipe):
+    """
+    Resolve independent input recipes concurrently, then settle the pool
+    itself without resolving its inputs again.  How many of them compile
+    at once is bounded by the job slots every CompileRecipe shares.
+    """
+    async def resolve(self):
+        async with self.lock:
+            self.failed = False
+            if self.done and not self.outdated:
+                return
+            if self.setup is not None:
+                await self.setup.resolve()
+            await asyncio.gather(*(recipe.resolve() for recipe in self.inputs))
+            # `all` is the default target below, not the builtin.
+            if not any(not recipe.done or recipe.outdated for recipe in self.inputs):
+                await self.make()
+                self.trigger(Event.SUCCESS)
+            else:
+                self.failed = True
+                self.trigger(Event.ERROR, AssertionError("Some recipes didn't complete successfully."))
 
 
 # -------------------------------------------------------------------
@@ -96,8 +375,76 @@ class FindLatestTarball(ValueRecipe):
         self.path = path.result
 
     async def compute(self):
-        tarballs = [*self.path.glob("*.tar.gz")]
-        return max(tarballs, key=lambda x: x.stat().st_mtime)
+        latest, latest_mtime = None, -1
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                if entry.name.endswith(".tar.gz"):
+                    mtime = entry.stat().st_mtime
+                    if mtime > latest_mtime:
+                        latest, latest_mtime = Path(entry.path), mtime
+        return latest
+
+
+# -------------------------------------------------------------------
+class HashedSdist(ShellFileRecipe):
+    """
+    Runs `setup.py sdist` only when the listed sources, or the submodule
+    headers MANIFEST.in ships, have changed since the last sdist, as
+    recorded by a digest stamp inside `dist/`.  The submodule headers are
+    globbed when the digest is taken, after `submodules` has checked
+    them out.
+    """
+    def __init__(self, sources, **params):
+        super().__init__("python3 setup.py sdist", output="dist", **params)
+        self.sources = sorted(Path(src) for src in sources)
+        self.stamp = self.output / ".sdist.sha256"
+
+    @property
+    def digest(self):
+        sha = hashlib.sha256()
+        submodule_headers = sorted(
+            path for submodule in SDIST_SUBMODULES for path in Path(submodule).rglob("*.h")
+        )
+        for src in [*self.sources, *submodule_headers]:
+            stat = src.stat()
+            sha.update(f"{src}:{stat.st_mtime_ns}:{stat.st_size}\n".encode("utf-8"))
+        return sha.hexdigest()
+
+    @property
+    def done(self):
+        return self.stamp.exists() and self.stamp.read_text() == self.digest
+
+    @property
+    def outdated(self):
+        return self.inputs_outdated
+
+    async def make(self):
+        await super().make()
+        self.stamp.write_text(self.digest)
+
+
+# -------------------------------------------------------------------
+class PypiUpload(Recipe):
+    def __init__(self, tarball, password):
+        super().__init__(input=[tarball, password])
+        self.tarball = tarball
+        self.password = password
+        self.uploaded = False
+
+    async def make(self):
+        from twine.commands.upload import upload
+        from twine.settings import Settings
+
+        self.trigger(Event.START, "twine upload -u %s %s" % (PYPI_USERNAME, self.tarball.result))
+        upload(
+            Settings(username=PYPI_USERNAME, password=self.password.result),
+            [str(self.tarball.result)],
+        )
+        self.uploaded = True
+
+    @property
+    def done(self):
+        return self.uploaded
 
 
 # -------------------------------------------------------------------
@@ -112,58 +459,87 @@ class GetPassword(ValueRecipe):
 
 # -------------------------------------------------------------------
 @factory
-def compile_pybind11_module_object(src, headers, tests):
-    return sh(
-        "{CC} -O3 -shared -Wall -std=c++2a -fPIC {flags} {src} -o {output}",
+def compile_pybind11_module_object(src, headers, pch, pymodule_flags):
+    """ Objects go under build/obj, seeded by source path so they are byte-identical across machines. """
+    OBJ_DIR.mkdir(parents=True, exist_ok=True)
+    output = OBJ_DIR / Path(src).with_suffix(".o").name
+    depfile = output.with_suffix(".d")
+    return HashedRecipe(
+        "{CC} {CFLAGS} -c -Wall -fPIC -fvisibility=hidden -fvisibility-inlines-hidden -frandom-seed={seed} -MMD -MP -MF {depfile} -include-pch {pch} @{flags} {src} -o {output}",
         env=RELEASE_ENV,
         src=src,
-        tests=tests,
-        output=Path(src).with_suffix(".o"),
-        flags=INCLUDES + shlex.split(check("python-config --includes")),
-        requires=headers,
+        pch=pch,
+        seed=hashlib.sha1(os.path.relpath(src).encode()).hexdigest()[:16],
+        depfile=depfile,
+        output=output,
+        flags=pymodule_flags,
+        fallback=headers,
+        requires=[pymodule_flags],
     )
 
 
+# -------------------------------------------------------------------
+def submodules_synced():
+    """ True if every submodule is checked out at its recorded commit. """
+    status = check("git submodule status")
+    return not any(line.startswith(("-", "+", "U")) for line in status.splitlines())
+
+
 # -------------------------------------------------------------------
 @provide
 def submodules():
-    return sh("git submodule update --init --recursive")
+    if os.environ.get("JOTDOWN_SKIP_SUBMODULES") == "1" or submodules_synced():
+        return sh("true")
+    # `git submodule update` has no --reference-if-able, so skip a mirror
+    # that isn't there rather than let both updates fail on it.
+    mirror = os.environ.get("JOTDOWN_GIT_MIRROR")
+    if mirror and not Path(mirror).is_dir():
+        mirror = None
+    return sh(
+        "git submodule update --init --recursive --jobs {jobs} --depth 1 --recommend-shallow {reference}"
+        " || git submodule update --init --recursive --jobs {jobs} {reference}",
+        env=dict(GIT_TERMINAL_PROMPT="0"),
+        jobs=JOBS,
+        reference=["--reference", mirror] if mirror else [],
+    )
 
 
 # -------------------------------------------------------------------
 @provide
 def headers():
-    return Path.cwd().glob("include/jotdown/*.h")
+    headers = scan("include/jotdown", ".h")
+    restore_unchanged_mtimes(headers, Path("build") / "header_hashes.json")
+    return headers
 
 
 # -------------------------------------------------------------------
 @provide
 async def demo_sources():
-    return Path.cwd().glob("demo/*.cpp")
+    return scan("demo", ".cpp")
 
 
 # -------------------------------------------------------------------
 @provide
 def test_sources():
-    return Path.cwd().glob("test/*.cpp")
+    return scan("test", ".cpp")
 
 
 # -------------------------------------------------------------------
 @target
 def demos(demo_sources, headers):
-    return [compile_demo(src, headers, RELEASE_ENV) for src in demo_sources]
+    return JobPool([compile_demo(src, headers, RELEASE_ENV) for src in demo_sources])
 
 
 # -------------------------------------------------------------------
 @target
 def tests(test_sources, headers, submodules):
-    return Recipe([compile_test(src, headers, TEST_ENV) for src in test_sources], setup=submodules)
+    return JobPool([compile_test(src, headers, TEST_ENV) for src in test_sources], setup=submodules)
 
 
 # -------------------------------------------------------------------
 @target
 def run_tests(tests):
-    return [run_test(app) for app in tests]
+    return JobPool([run_test(app) for app in tests])
 
 # -------------------------------------------------------------------
 @target
@@ -171,32 +547,87 @@ def pybind11_tests(submodules):
     return Recipe([
         sh("mkdir -p {output}", output="pybind11-test-build"),
         sh("cmake ../pybind11", cwd=Path("pybind11-test-build")),
-        sh("make check -j 4", cwd=Path("pybind11-test-build"), interactive=True),
+        sh("make check -j {jobs}", jobs=JOBS, cwd=Path("pybind11-test-build"), interactive=True),
     ], synchronous=True, setup=submodules)
 
 
 # -------------------------------------------------------------------
 @provide
 def pymodule_sources(submodules):
-    return Path.cwd().glob("src/*.cpp")
+    return scan("src", ".cpp")
+
+
+# -------------------------------------------------------------------
+@provide
+def pymodule_flags():
+    """
+    Python include flags for the module and its PCH, kept in a response
+    file whose mtime only moves when they change (e.g. a new Python).
+    """
+    return Path(response_file("pymodule", PYTHON_INCLUDES)[1:])
+
+
+# -------------------------------------------------------------------
+@provide
+def pch(submodules, pymodule_flags):
+    src = Path("src/jotdown_pch.h")
+    PCH_DIR.mkdir(parents=True, exist_ok=True)
+    depfile = PCH_DIR / src.with_suffix(".d").name
+    return CompileRecipe(
+        "{CC} {CFLAGS} -Wall -fPIC -fvisibility=hidden -fvisibility-inlines-hidden -MMD -MP -MF {depfile} -Xclang -fno-pch-timestamp -fpch-instantiate-templates -x c++-header @{flags} {src} -o {output}",
+        env=RELEASE_ENV,
+        src=src,
+        depfile=depfile,
+        output=PCH_DIR / (src.name + ".pch"),
+        flags=pymodule_flags,
+        requires=[*depfile_headers(depfile, [src]), pymodule_flags],
+    ).with_setup(submodules)
 
 
 # -------------------------------------------------------------------
 @target
-def pymodule_objects(pymodule_sources, headers, run_tests):
-    return [compile_pybind11_module_object(src, headers, run_tests) for src in pymodule_sources]
+def pymodule_objects(pymodule_sources, headers, pch, pymodule_flags):
+    return JobPool([
+        compile_pybind11_module_object(src, headers, pch, pymodule_flags)
+        for src in pymodule_sources
+    ])
 
 
 # -------------------------------------------------------------------
 @target
 def pymodule_dev(pymodule_objects):
-    return link_pybind11_module(pymodule_objects)
+    return link_pybind11_module(pymodule_objects, Path("build"))
+
+
+# -------------------------------------------------------------------
+@provide
+def unity_source(pymodule_sources):
+    # Relative to build/, so the file doesn't depend on where the tree is
+    # checked out and ccache can share it across checkouts.
+    unity = Path("build") / "_unity.cpp"
+    content = "".join(
+        '#include "%s"\n' % os.path.relpath(src, unity.parent) for src in pymodule_sources
+    )
+    return write_if_changed(unity, content)
 
 
 # -------------------------------------------------------------------
 @target
-def pymodule_sdist(submodules):
-    return sh("python3 setup.py sdist", output="dist")
+def pymodule_release(unity_source, headers, pch, pymodule_flags):
+    return link_pybind11_module(
+        Recipe([compile_pybind11_module_object(unity_source, headers, pch, pymodule_flags)]),
+        Path("build") / "release",
+    )
+
+
+# -------------------------------------------------------------------
+@target
+def pymodule_sdist(submodules, run_tests, pymodule_sources, headers):
+    return HashedSdist(
+        [*SDIST_FILES, *pymodule_sources, *headers],
+        submodules=submodules,
+        tests=run_tests,
+    )
 
 
 # -------------------------------------------------------------------
@@ -214,13 +645,13 @@ def pypi_password():
 # -------------------------------------------------------------------
 @target
 def upload_to_pypi(latest_tarball, pypi_password):
-    return sh(
-        "twine upload -u {PYPI_USERNAME} -p {password} {input}",
-        PYPI_USERNAME=PYPI_USERNAME,
-        password=pypi_password,
-        input=latest_tarball,
-        redacted=['password']
-    )
+    return PypiUpload(latest_tarball, pypi_password)
+
+
+# -------------------------------------------------------------------
+@target
+def ccache_stats():
+    return sh("ccache -s")
 
 
 # -------------------------------------------------------------------
@@ -230,4 +661,7 @@ def all(demos, pymodule_dev):
 
 
 # -------------------------------------------------------------------
-build()
+if __name__ == "__main__":
+    for cmd in PREFETCH_CHECKS:
+        check_async(cmd)
+    build()
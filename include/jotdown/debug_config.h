@@ -0,0 +1,18 @@
+/*
+ * debug_config.h
+ *
+ * Force-included (-include) by debug and test builds to enable moonlight's
+ * debugging aids, so those builds differ from release only by this header.
+ *
+ * Distributed under terms of the MIT license.
+ */
+
+#ifndef __JOTDOWN_DEBUG_CONFIG_H
+#define __JOTDOWN_DEBUG_CONFIG_H
+
+#define MOONLIGHT_AUTOMATA_DEBUG 1
+#define MOONLIGHT_DEBUG 1
+#define MOONLIGHT_ENABLE_STACKTRACE 1
+#define MOONLIGHT_STACKTRACE_IN_DESCRIPTION 1
+
+#endif /* !__JOTDOWN_DEBUG_CONFIG_H */
@@ -1,12 +1,51 @@
+import os
+import types
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from setuptools import setup
+from setuptools.command.build_ext import build_ext
 from setuptools.extension import Extension
 
+
+def parallel_compile(self, sources, output_dir=None, macros=None, include_dirs=None,
+                     debug=0, extra_preargs=None, extra_postargs=None, depends=None):
+    """ Drop-in for CCompiler.compile() that compiles each source on its own thread. """
+    macros, objects, extra_postargs, pp_opts, build = self._setup_compile(
+        output_dir, macros, include_dirs, sources, depends, extra_postargs
+    )
+    cc_args = self._get_cc_args(pp_opts, debug, extra_preargs)
+
+    def compile_one(obj):
+        src, ext = build[obj]
+        self._compile(obj, src, ext, cc_args, extra_postargs, pp_opts)
+
+    with ThreadPoolExecutor(os.cpu_count()) as pool:
+        list(pool.map(compile_one, [obj for obj in objects if obj in build]))
+    return objects
+
+
+class ParallelBuildExt(build_ext):
+    def build_extensions(self):
+        # parallel_compile() relies on the UnixCCompiler _compile() signature;
+        # MSVC and the other compilers keep their own compile().
+        if self.compiler.compiler_type == "unix":
+            self.compiler.compile = types.MethodType(parallel_compile, self.compiler)
+        super().build_extensions()
+
+
 pymodule = Extension(
     name="jotdown",
     include_dirs=["include", "moonlight/include", "pybind11/include"],
     sources=[str(src) for src in Path.cwd().glob("src/*.cpp")],
-    extra_compile_args=["-O3", "-shared", "-Wall", "-std=c++2a", "-fPIC"],
+    extra_compile_args=[
+        "-O3",
+        "-Wall",
+        "-std=c++2a",
+        "-fPIC",
+        "-fvisibility=hidden",
+        "-fvisibility-inlines-hidden",
+        "-fno-plt",
+    ],
 )
 
 # Get the long description from the README file
@@ -32,6 +71,7 @@ setup(
     ],
     keywords="document structure parser query language",
     ext_modules=[pymodule],
+    cmdclass={"build_ext": ParallelBuildExt},
     zip_safe=False,
     include_package_data=True,
 )
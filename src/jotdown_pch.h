@@ -0,0 +1,26 @@
+/*
+ * jotdown_pch.h
+ *
+ * Umbrella header for the precompiled header shared by the pybind11
+ * module objects.  Only third-party headers belong here, so that edits to
+ * jotdown's own headers don't invalidate the PCH.
+ *
+ * Distributed under terms of the MIT license.
+ */
+
+#ifndef __JOTDOWN_PCH_H
+#define __JOTDOWN_PCH_H
+
+#include "pybind11/operators.h"
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include "moonlight/classify.h"
+#include "moonlight/collect.h"
+#include "moonlight/exceptions.h"
+#include "moonlight/generator.h"
+#include "moonlight/hash.h"
+#include "moonlight/json.h"
+#include "moonlight/slice.h"
+
+#endif /* !__JOTDOWN_PCH_H */